@@ -35,12 +35,11 @@ def make_dct_matrix(L):
         DCT matrix.
 
     """
-    W = np.empty((L, L))
     n = (np.arange(L) + 0.5) * (np.pi / L)
-    c = np.sqrt(2 / L)
-    for k in range(L):
-        z = np.sqrt(1 / L) if k == 0 else c
-        W[:, k] = z * np.cos(k * n)
+    k = np.arange(L)
+    z = np.full(L, np.sqrt(2 / L))
+    z[0] = np.sqrt(1 / L)
+    W = z * np.cos(np.outer(n, k))
     return W
 
 
@@ -14,7 +14,6 @@
 # limitations under the License.                                           #
 # ------------------------------------------------------------------------ #
 
-import torch
 import torch.nn as nn
 
 
@@ -55,7 +54,8 @@ class Decimation(nn.Module):
         Returns
         -------
         y : Tensor [shape=(..., T/P-S, ...)]
-            Decimated signal.
+            Decimated signal. This is a view of the input, so in-place operations
+            on it also modify the input.
 
         Examples
         --------
@@ -66,9 +66,7 @@ class Decimation(nn.Module):
         tensor([1, 4, 7])
 
         """
-        T = x.shape[dim]
-        indices = torch.arange(
-            self.start, T, self.period, dtype=torch.long, device=x.device
-        )
-        y = torch.index_select(x, dim, indices)
+        index = [slice(None)] * x.dim()
+        index[dim] = slice(self.start, None, self.period)
+        y = x[tuple(index)]
         return y
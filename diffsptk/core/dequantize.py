@@ -47,12 +47,16 @@ class InverseUniformQuantization(nn.Module):
         if quantizer == 0 or quantizer == "mid-rise":
             self.level = int(2**n_bit)
             self.quantizer = "mid-rise"
+            self.bias = self.level // 2 - 0.5
         elif quantizer == 1 or quantizer == "mid-tread":
             self.level = int(2**n_bit) - 1
             self.quantizer = "mid-tread"
+            self.bias = (self.level - 1) // 2
         else:
             raise ValueError("quantizer {quantizer} is not supported")
 
+        self.scale = 2 * self.abs_max / self.level
+
     def forward(self, y):
         """Dequantize input.
 
@@ -78,13 +82,6 @@ class InverseUniformQuantization(nn.Module):
         tensor([-3., -3., -1., -1.,  1.,  1.,  3.,  3.,  3.])
 
         """
-        if self.quantizer == "mid-rise":
-            y = y - (self.level // 2 - 0.5)
-        elif self.quantizer == "mid-tread":
-            y = y - (self.level - 1) // 2
-        else:
-            raise RuntimeError
-
-        x = y * (2 * self.abs_max / self.level)
+        x = (y - self.bias) * self.scale
         x = torch.clip(x, min=-self.abs_max, max=self.abs_max)
         return x
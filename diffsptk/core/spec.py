@@ -91,17 +91,19 @@ class Spectrum(nn.Module):
         tensor([36.0000, 25.3137,  8.0000,  2.6863,  4.0000])
 
         """
-        X = torch.fft.rfft(b, n=self.fft_length).abs()
+        B = torch.fft.rfft(b, n=self.fft_length)
+        X = torch.square(B.real) + torch.square(B.imag)
 
         if a is not None:
             K, a1 = torch.split(a, [1, a.size(-1) - 1], dim=-1)
             a = torch.cat((K * 0 + 1, a1), dim=-1)
-            X /= torch.fft.rfft(a, n=self.fft_length).abs()
-            X *= K
+            A = torch.fft.rfft(a, n=self.fft_length)
+            X = X / (torch.square(A.real) + torch.square(A.imag))
+            X = X * torch.square(K)
 
-        y = torch.square(X) + self.eps
+        y = X + self.eps
         if self.relative_floor is not None:
             m, _ = torch.max(y, dim=-1, keepdim=True)
-            y = torch.maximum(y, m * self.relative_floor)
+            y = torch.clamp_min(y, m * self.relative_floor)
         y = self.convert(y)
         return y
@@ -36,4 +36,17 @@ def test_compatibility(device, P=2, S=1, T=20, L=4):
         opt={"dim": 0},
     )
 
+    U.check_compatibility(
+        device,
+        decimate,
+        [],
+        f"ramp -l {T*L}",
+        f"decimate -l {L} -p {P} -s {S}",
+        [],
+        dx=(T, L),
+        dy=L,
+        opt={"dim": 1},
+    )
+
     U.check_differentiable(device, decimate, [T])
+    U.check_differentiable(device, decimate, [2, T, L], opt={"dim": 1})
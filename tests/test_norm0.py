@@ -20,7 +20,7 @@ import diffsptk
 import tests.utils as U
 
 
-@pytest.mark.parametrize("device", ["cpu", "cuda"])
+@pytest.mark.parametrize("device", U.DEVICES)
 def test_compatibility(device, B=2, M=4):
     norm0 = diffsptk.AllPoleToAllZeroDigitalFilterCoefficients(M)
 
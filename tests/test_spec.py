@@ -56,4 +56,39 @@ def test_compatibility(device, out_format, relative_floor, L=16, B=2, eps=0.01):
         dy=L // 2 + 1,
     )
 
+    N = L // 2
+    U.check_compatibility(
+        device,
+        spec,
+        [f"nrand -s 1 -l {B*L} > {tmp1}", f"nrand -s 2 -l {B*(N+1)} > {tmp2}"],
+        [f"cat {tmp1}", f"cat {tmp2}"],
+        (
+            f"spec -l {L} -o {out_format} -e {eps} {opt} "
+            f"-m {L-1} -z {tmp1} -n {N} -p {tmp2}"
+        ),
+        [f"rm {tmp1} {tmp2}"],
+        dx=[L, N + 1],
+        dy=L // 2 + 1,
+    )
+
+    # A single denominator frame is broadcast over all numerator frames.
+    tmp3 = "spec.tmp3"
+    U.check_compatibility(
+        device,
+        spec,
+        [
+            f"nrand -s 1 -l {B*L} > {tmp1}",
+            f"nrand -s 2 -l {L} > {tmp2}",
+            f"cat {' '.join([tmp2] * B)} > {tmp3}",
+        ],
+        [f"cat {tmp1}", f"cat {tmp2}"],
+        (
+            f"spec -l {L} -o {out_format} -e {eps} {opt} "
+            f"-m {L-1} -z {tmp1} -n {L-1} -p {tmp3}"
+        ),
+        [f"rm {tmp1} {tmp2} {tmp3}"],
+        dx=L,
+        dy=L // 2 + 1,
+    )
+
     U.check_differentiable(device, spec, [(B, L), (B, L)])
@@ -20,9 +20,20 @@ import time
 import warnings
 
 import numpy as np
+import pytest
 import soundfile as sf
 import torch
 
+DEVICES = [
+    pytest.param("cpu"),
+    pytest.param(
+        "cuda",
+        marks=pytest.mark.skipif(
+            not torch.cuda.is_available(), reason="CUDA unavailable"
+        ),
+    ),
+]
+
 
 def is_array(x):
     return type(x) is list or type(x) is tuple
@@ -44,6 +55,12 @@ def allclose(a, b, rtol=None, atol=None):
     return np.allclose(a, b, rtol=rtol, atol=atol)
 
 
+def corrcoef(a, b):
+    a = np.ravel(a) - np.mean(a)
+    b = np.ravel(b) - np.mean(b)
+    return np.dot(a, b) / np.sqrt(np.dot(a, a) * np.dot(b, b))
+
+
 def call(cmd, get=True):
     if get:
         res = subprocess.run(